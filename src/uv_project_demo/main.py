@@ -7,6 +7,10 @@
 from typing import Optional
 import sys
 
+_GREET_DEFAULT = "Hello from uv-project-demo!"
+_GREET_PREFIX = "Hello "
+_GREET_SUFFIX = " from uv-project-demo!"
+
 
 def greet(name: Optional[str] = None) -> str:
     """
@@ -19,8 +23,8 @@ def greet(name: Optional[str] = None) -> str:
         str: 格式化的问候消息
     """
     if name:
-        return f"Hello {name} from uv-project-demo!"
-    return "Hello from uv-project-demo!"
+        return _GREET_PREFIX + name + _GREET_SUFFIX
+    return _GREET_DEFAULT
 
 
 def main() -> None: